@@ -1,100 +1,188 @@
+import os
 import pandas as pd
 import numpy as np
+import matplotlib
+HEADLESS = bool(os.environ.get("ESG_HEADLESS"))  # Batch/CI runs: no GUI toolkit, dashboard is saved to PNG
+if HEADLESS:
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import seaborn as sns
 from matplotlib.ticker import FuncFormatter # Importing the formatter
 
+sns.set_theme(style="whitegrid")  # Applied once at import, not on every dashboard build
+
+def build_dashboard(df, esap_status, fig=None):
+    """
+    Draws the 2x2 ESG risk dashboard; esap_status is the ESAP summary table
+    built in main(). Pass an existing dashboard figure to clear and redraw
+    its axes in place (e.g. repeated runs in a notebook).
+    """
+    if fig is None:
+        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    else:
+        axes = np.array(fig.axes).reshape(2, 2)
+        for ax in axes.flat:
+            ax.cla()
+    fig.suptitle('South Asia Portfolio: ESG Risk Dashboard', fontsize=18, weight='bold')
+
+    # Chart 1: High Risk Clients by Sector (sector x flag counts from one bincount)
+    sectors = df["Sector"].cat.categories
+    n_sectors = len(sectors)
+    flag_counts = np.bincount(
+        df["Sector"].cat.codes.to_numpy() * 2 + df["High_Risk_Flag"].to_numpy(),
+        minlength=2 * n_sectors
+    ).reshape(n_sectors, 2)
+    x = np.arange(n_sectors)
+    reds = sns.color_palette('Reds', 2)
+    axes[0, 0].bar(x - 0.2, flag_counts[:, 0], 0.4, label='No', color=reds[0])
+    axes[0, 0].bar(x + 0.2, flag_counts[:, 1], 0.4, label='Yes', color=reds[1])
+    axes[0, 0].set_title("Count of High-Risk Clients by Sector", fontsize=14)
+    axes[0, 0].legend(title='High Risk Flag')
+    axes[0, 0].set_xticks(x)
+    axes[0, 0].set_xticklabels(sectors, rotation=45, ha='right')
+    axes[0, 0].set_xlabel("Sector", fontsize=12)
+    axes[0, 0].set_ylabel("Count")
+
+    # --- Chart 2: Total Loan Exposure by Country (WITH BILLION FORMATTER) ---
+    
+    # 1. Define the formatting function
+    def billions(x, pos):
+        """Converts numbers to Billions (e.g., 1,500,000,000 -> 1.5B)"""
+        return f'{x*1e-9:.1f}B'
+
+    country_risk = (
+        df.groupby('Country', as_index=False, observed=True, sort=False)['Loan_Amount_USD'].sum()
+        .sort_values(by='Loan_Amount_USD', ascending=False, ignore_index=True, kind='stable')
+    )
+    sns.barplot(ax=axes[0, 1], data=country_risk, x='Loan_Amount_USD', y='Country', hue='Country',
+                palette='viridis', legend=False, order=country_risk['Country'],
+                hue_order=country_risk['Country'])  # Keep exposure order, not category order
+    axes[0, 1].set_title("Total Exposure by Country (USD)", fontsize=14)
+    axes[0, 1].set_xlabel("Exposure (Billions $)")
+    
+    # 2. Apply the formatter to the X-axis
+    axes[0, 1].xaxis.set_major_formatter(FuncFormatter(billions))
+
+    # Chart 3: ESAP Status (reuses the counts from the summary table)
+    axes[1, 0].pie(esap_status["Number_of_Clients"], labels=esap_status["ESAP_Status"], autopct='%1.1f%%',
+                   colors=sns.color_palette('pastel'), startangle=90)
+    axes[1, 0].set_title("Portfolio ESAP Status Overview", fontsize=14)
+
+    # Chart 4: Green vs Standard Risk Scores
+    green = df["Green_Finance_Tag"].to_numpy()
+    scores = df["Total_ESG_Risk_Score"].to_numpy()
+    box = axes[1, 1].boxplot([scores[green], scores[~green]], patch_artist=True)
+    for patch, color in zip(box['boxes'], sns.color_palette('Greens', 2)):
+        patch.set_facecolor(color)
+    axes[1, 1].set_xticks([1, 2], ["Yes", "No"])
+    axes[1, 1].set_xlabel("Green_Finance_Tag")
+    axes[1, 1].set_title("ESG Risk Score Distribution: Green vs. Standard", fontsize=14)
+    axes[1, 1].set_ylabel("Total ESG Risk Score (2-6)")
+
+    # --- LAYOUT FIX ---
+    fig.tight_layout(rect=[0, 0.03, 1, 0.95], h_pad=4.0, w_pad=2.0)
+
+    return fig
+
 def main():
     # ==========================================
     # 1. SETUP & RANDOM DATA GENERATION (SOUTH ASIA)
     # ==========================================
     print("--- [1/6] Generating synthetic South Asia portfolio data... ---")
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n = 200
+    sectors = ["Agribusiness", "Manufacturing", "Textiles", "Renewable Energy", "Infrastructure", "Financial Services"]
+    countries = ["India", "Bangladesh", "Sri Lanka", "Pakistan", "Nepal", "Bhutan", "Maldives"]
+    esap_states = ["Not Started", "In Progress", "Delayed", "Closed"]
+    yes_no = ["Yes", "No"]
+    risk_levels = ["Low", "Medium", "High"]  # Ordinal: category code + 1 = score
 
     data = {
-        "Client_ID": [f"SA-{i:03d}" for i in range(1, n+1)],
-        "Sector": np.random.choice(
-            ["Agribusiness", "Manufacturing", "Textiles", "Renewable Energy", "Infrastructure", "Financial Services"],
-            size=n
-        ),
-        "Country": np.random.choice(
-            ["India", "Bangladesh", "Sri Lanka", "Pakistan", "Nepal", "Bhutan", "Maldives"],
+        "Sector": rng.choice(sectors, size=n),
+        "Country": rng.choice(
+            countries,
             size=n,
             p=[0.4, 0.2, 0.1, 0.15, 0.05, 0.05, 0.05]
         ),
         # INCREASED LOAN AMOUNTS slightly so 'Billions' format looks better
-        "Loan_Amount_USD": np.random.randint(5000000, 50000000, size=n),
-        "Environmental_Risk": np.random.choice(["Low", "Medium", "High"], size=n, p=[0.3, 0.5, 0.2]),
-        "Social_Risk": np.random.choice(["Low", "Medium", "High"], size=n, p=[0.4, 0.4, 0.2]),
-        "HSE_Compliance": np.random.choice(["Yes", "No"], size=n, p=[0.70, 0.30]),
-        "ESAP_Status": np.random.choice(
-            ["Not Started", "In Progress", "Delayed", "Closed"],
+        # int32 is ample for single facilities (< $2.1B); portfolio totals are summed as int64
+        "Loan_Amount_USD": rng.integers(5000000, 50000000, size=n, dtype=np.int32),
+        "Environmental_Risk": pd.Categorical.from_codes(
+            rng.choice(3, size=n, p=[0.3, 0.5, 0.2]), categories=risk_levels, ordered=True
+        ),
+        "Social_Risk": pd.Categorical.from_codes(
+            rng.choice(3, size=n, p=[0.4, 0.4, 0.2]), categories=risk_levels, ordered=True
+        ),
+        "HSE_Compliance": rng.choice(yes_no, size=n, p=[0.70, 0.30]),
+        "ESAP_Status": rng.choice(
+            esap_states,
             size=n,
             p=[0.25, 0.45, 0.10, 0.20]
         ),
-        "Green_Finance_Tag": np.random.choice(["Yes", "No"], size=n, p=[0.20, 0.80])
+        "Green_Finance_Tag": rng.random(n) < 0.20
     }
 
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(data, index=pd.RangeIndex(1, n+1, name="Client_ID"))
+
+    # Low-cardinality labels -> categorical (int8 codes + one shared dictionary)
+    for col, labels in [("Sector", sectors), ("Country", countries), ("HSE_Compliance", yes_no),
+                        ("ESAP_Status", esap_states)]:
+        df[col] = pd.Categorical(df[col], categories=labels)
 
     # ==========================================
     # 2. RISK SCORING & CALCULATION
     # ==========================================
     print("--- [2/6] Calculating ESG risk scores... ---")
-    risk_map = {"Low": 1, "Medium": 2, "High": 3}
-
-    df["E_Risk_Score"] = df["Environmental_Risk"].map(risk_map)
-    df["S_Risk_Score"] = df["Social_Risk"].map(risk_map)
+    df["E_Risk_Score"] = df["Environmental_Risk"].cat.codes.to_numpy(dtype=np.int8) + 1
+    df["S_Risk_Score"] = df["Social_Risk"].cat.codes.to_numpy(dtype=np.int8) + 1
     
     # Total Score (Range 2 to 6)
     df["Total_ESG_Risk_Score"] = df["E_Risk_Score"] + df["S_Risk_Score"]
 
     # Flag High Risk Clients (Threshold >= 5)
-    df["High_Risk_Flag"] = np.where(df["Total_ESG_Risk_Score"] >= 5, "Yes", "No")
+    df["High_Risk_Flag"] = df["Total_ESG_Risk_Score"] >= 5
 
     # ==========================================
     # 3. AGGREGATION & SUMMARY TABLES
     # ==========================================
     print("--- [3/6] Aggregating portfolio metrics... ---")
-    
-    # Portfolio Summary by Sector
-    portfolio_summary = (
-        df.groupby("Sector")
-        .agg(
-            Total_Loan_Amount=("Loan_Amount_USD", "sum"),
-            Avg_ESG_Risk=("Total_ESG_Risk_Score", "mean"),
-            High_Risk_Clients=("High_Risk_Flag", lambda x: (x == "Yes").sum())
-        )
-        .reset_index()
-        .sort_values(by="Total_Loan_Amount", ascending=False)
-    )
 
-    # ESAP Status Count
-    esap_status = (
-        df.groupby("ESAP_Status")
-        .size()
-        .reset_index(name="Number_of_Clients")
-    )
+    loan = df["Loan_Amount_USD"].to_numpy()
+
+    # Portfolio Summary by Sector (codes extracted once, then one bincount per measure)
+    sector_names = df["Sector"].cat.categories
+    sector_codes = df["Sector"].cat.codes.to_numpy()
+    n_sectors = len(sector_names)
+    sector_clients = np.bincount(sector_codes, minlength=n_sectors)
+    sector_loans = np.bincount(sector_codes, weights=loan, minlength=n_sectors)
+    sector_scores = np.bincount(sector_codes, weights=df["Total_ESG_Risk_Score"].to_numpy(), minlength=n_sectors)
+    sector_high = np.bincount(sector_codes, weights=df["High_Risk_Flag"].to_numpy(), minlength=n_sectors)
+    observed = sector_clients > 0
+    portfolio_summary = pd.DataFrame({
+        "Sector": sector_names[observed],
+        "Total_Loan_Amount": sector_loans[observed].astype(np.int64),
+        "Avg_ESG_Risk": sector_scores[observed] / sector_clients[observed],
+        "High_Risk_Clients": sector_high[observed].astype(np.int64)
+    }).sort_values(by="Total_Loan_Amount", ascending=False, ignore_index=True, kind="stable")
 
-    # Green Finance Overview
-    green_finance = (
-        df.groupby("Green_Finance_Tag")
-        .agg(
-            Clients=("Client_ID", "count"),
-            Loan_Book=("Loan_Amount_USD", "sum")
-        )
-        .reset_index()
-    )
+    # ESAP Status Count
+    esap_names = df["ESAP_Status"].cat.categories
+    esap_clients = np.bincount(df["ESAP_Status"].cat.codes.to_numpy(), minlength=len(esap_names))
+    observed = esap_clients > 0
+    esap_status = pd.DataFrame({
+        "ESAP_Status": esap_names[observed],
+        "Number_of_Clients": esap_clients[observed]
+    })
 
     # ==========================================
     # 4. EXPORT TO CSV
     # ==========================================
     print("--- [4/6] Exporting data to CSV... ---")
     try:
-        df.to_csv("south_asia_loan_portfolio.csv", index=False)
-        portfolio_summary.to_csv("south_asia_portfolio_summary.csv", index=False)
-        print(" -> Files saved: 'south_asia_loan_portfolio.csv' and 'south_asia_portfolio_summary.csv'")
+        # Client IDs are formatted (SA-001, ...) only on export; in memory they stay a RangeIndex
+        df.rename(index="SA-{:03d}".format).to_csv("south_asia_loan_portfolio.csv.gz", compression="gzip")
+        portfolio_summary.to_csv("south_asia_portfolio_summary.csv.gz", index=False, compression="gzip")
+        print(" -> Files saved: 'south_asia_loan_portfolio.csv.gz' and 'south_asia_portfolio_summary.csv.gz'")
     except Exception as e:
         print(f" -> Error saving CSVs: {e}")
 
@@ -105,9 +193,9 @@ def main():
     print("SOUTH ASIA REGION: ESG RISK MANAGEMENT REPORT")
     print("="*50)
     
-    total_val = df['Loan_Amount_USD'].sum()
-    high_risk_count = df[df['High_Risk_Flag']=='Yes'].shape[0]
-    green_book = green_finance[green_finance['Green_Finance_Tag']=='Yes']['Loan_Book'].values[0] if 'Yes' in green_finance['Green_Finance_Tag'].values else 0
+    total_val = loan.sum(dtype=np.int64)
+    high_risk_count = int(df['High_Risk_Flag'].sum())
+    green_book = loan[df['Green_Finance_Tag'].to_numpy()].sum(dtype=np.int64)
 
     print(f"Total Portfolio Value:   ${total_val:,.2f}")
     print(f"Total Clients:           {n}")
@@ -127,49 +215,15 @@ def main():
     # 6. VISUALIZATION DASHBOARD
     # ==========================================
     print("--- [5/6] Generating Dashboard... ---")
+    fig = build_dashboard(df, esap_status)
     
-    sns.set_theme(style="whitegrid")
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
-    fig.suptitle('South Asia Portfolio: ESG Risk Dashboard', fontsize=18, weight='bold')
-
-    # Chart 1: High Risk Clients by Sector
-    sns.countplot(ax=axes[0, 0], data=df, x='Sector', hue='High_Risk_Flag', palette='Reds')
-    axes[0, 0].set_title("Count of High-Risk Clients by Sector", fontsize=14)
-    axes[0, 0].legend(title='High Risk Flag')
-    axes[0, 0].set_xticklabels(axes[0, 0].get_xticklabels(), rotation=45, ha='right')
-    axes[0, 0].set_xlabel("Sector", fontsize=12)
-
-    # --- Chart 2: Total Loan Exposure by Country (WITH BILLION FORMATTER) ---
-    
-    # 1. Define the formatting function
-    def billions(x, pos):
-        """Converts numbers to Billions (e.g., 1,500,000,000 -> 1.5B)"""
-        return f'{x*1e-9:.1f}B'
-
-    country_risk = df.groupby('Country')['Loan_Amount_USD'].sum().sort_values(ascending=False).reset_index()
-    sns.barplot(ax=axes[0, 1], data=country_risk, x='Loan_Amount_USD', y='Country', palette='viridis')
-    axes[0, 1].set_title("Total Exposure by Country (USD)", fontsize=14)
-    axes[0, 1].set_xlabel("Exposure (Billions $)")
-    
-    # 2. Apply the formatter to the X-axis
-    axes[0, 1].xaxis.set_major_formatter(FuncFormatter(billions))
-
-    # Chart 3: ESAP Status
-    esap_counts = df['ESAP_Status'].value_counts()
-    axes[1, 0].pie(esap_counts, labels=esap_counts.index, autopct='%1.1f%%', 
-                   colors=sns.color_palette('pastel'), startangle=90)
-    axes[1, 0].set_title("Portfolio ESAP Status Overview", fontsize=14)
-
-    # Chart 4: Green vs Standard Risk Scores
-    sns.boxplot(ax=axes[1, 1], data=df, x='Green_Finance_Tag', y='Total_ESG_Risk_Score', palette='Greens')
-    axes[1, 1].set_title("ESG Risk Score Distribution: Green vs. Standard", fontsize=14)
-    axes[1, 1].set_ylabel("Total ESG Risk Score (2-6)")
-
-    # --- LAYOUT FIX ---
-    plt.tight_layout(rect=[0, 0.03, 1, 0.95], h_pad=4.0, w_pad=2.0)
-    
-    print("--- [6/6] Dashboard launched. Close window to finish. ---")
-    plt.show()
+    if HEADLESS:
+        fig.savefig("south_asia_dashboard.png", dpi=100, bbox_inches="tight")
+        plt.close(fig)
+        print("--- [6/6] Dashboard saved: 'south_asia_dashboard.png' ---")
+    else:
+        print("--- [6/6] Dashboard launched. Close window to finish. ---")
+        plt.show()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,174 +4,263 @@
 # VERSION: Final Partner-Ready (Risk-First Logic)
 # ==============================================================================
 
+import argparse
+import os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 
 # ------------------------------------------------------------------------------
 # GLOBAL SETTINGS
 # ------------------------------------------------------------------------------
-np.random.seed(2024)  # Ensures the "Client Scenario" is reproducible
-plt.rcParams['figure.dpi'] = 120
-sns.set_theme(style="whitegrid")  # Professional consulting aesthetic
+HEADLESS = bool(os.environ.get('ESG_HEADLESS'))  # Batch/CI runs: save charts instead of opening windows
+plt = None  # matplotlib.pyplot, bound by setup_plotting() only when charts are drawn
 
-print(">>> INITIALIZING ESG RISK DIAGNOSTIC ENGINE...")
+def setup_plotting():
+    """
+    Imports and styles matplotlib/seaborn on first use, so compute-only runs
+    (--no-plot) and importers of this module never load the plotting stack.
+    Every plot_* function calls this first, so each can be used on its own.
+    """
+    global plt
+    if plt is not None:
+        return
+    import matplotlib
+    if HEADLESS:
+        matplotlib.use('Agg')
+    import matplotlib.pyplot
+    import seaborn as sns
+    plt = matplotlib.pyplot
+    plt.rcParams['figure.dpi'] = 120
+    sns.set_theme(style="whitegrid")  # Professional consulting aesthetic
+
+def show_or_save(fig, name):
+    """Opens the chart interactively, or in headless mode saves it to <name>.png and frees it."""
+    if HEADLESS:
+        fig.savefig(f'{name}.png', dpi=100, bbox_inches='tight')
+        plt.close(fig)
+    else:
+        plt.show()
 
 # ==============================================================================
 # PHASE 1: SYNTHETIC DATA GENERATION (THE "LOAN TAPE")
 # ==============================================================================
 
-def generate_portfolio(n_clients=400):
+SECTORS = ['Renewable Energy', 'Agribusiness', 'Manufacturing',
+           'Infrastructure', 'Oil & Gas', 'TMT', 'Financial Services']
+COUNTRIES = ['Vietnam', 'Indonesia', 'Kenya', 'Nigeria']
+RISK_LEVELS = ['Low', 'Medium', 'High']  # Ordinal: category code + 1 = score
+ESAP_STATES = ['Not Started', 'In Progress', 'Delayed', 'Closed']
+
+def simulate_loan_tape(n_clients, rng):
     """
-    Simulates a multi-country commercial loan portfolio (Emerging Markets).
-    Includes sector-correlated Environmental & Social risk characteristics.
+    Draws the raw loan tape as integer codes into SECTORS / COUNTRIES /
+    RISK_LEVELS / ESAP_STATES, fully vectorised (no per-client Python loop).
+    Returns (sec_code, country_code, exposure, env_code, soc_code, esap_code, green_tag).
     """
-    sectors = ['Renewable Energy', 'Agribusiness', 'Manufacturing', 
-               'Infrastructure', 'Oil & Gas', 'TMT', 'Financial Services']
-    countries = ['Vietnam', 'Indonesia', 'Kenya', 'Nigeria']
-    risk_levels = ['High', 'Medium', 'Low']
-    esap_states = ['Not Started', 'In Progress', 'Delayed', 'Closed']
+    # Sector -> probability-row lookups (columns follow RISK_LEVELS)
+    heavy_industry = ['Oil & Gas', 'Agribusiness', 'Manufacturing']
+    labour_intensive = ['Agribusiness', 'Infrastructure']
+    env_probs = np.array([
+        [0.1, 0.3, 0.6] if s in heavy_industry      # Heavy Industry = Higher Environmental Risk
+        else [1.0, 0.0, 0.0] if s == 'Renewable Energy'
+        else [0.5, 0.4, 0.1]
+        for s in SECTORS
+    ])
+    soc_probs = np.array([
+        [0.1, 0.4, 0.5] if s in labour_intensive    # Labor/Community focus
+        else [0.5, 0.4, 0.1]
+        for s in SECTORS
+    ])
+
+    def draw(prob_rows, u):
+        """Inverse-CDF draw of one column index per row of prob_rows, given uniforms u."""
+        cdf = prob_rows.cumsum(axis=1)
+        cdf[:, -1] = 1.0  # Guard against float round-off in the last bucket
+        return (u[:, None] < cdf).argmax(axis=1)
+
+    # One uniform buffer for every categorical draw: sector, env, soc, esap, country
+    u = rng.random((n_clients, 5), dtype=np.float32)
 
     # 1. Sector Weights (Heavy on Transition-Sensitive sectors)
     weights = [0.15, 0.20, 0.20, 0.15, 0.10, 0.10, 0.10]
-    client_sectors = np.random.choice(sectors, n_clients, p=weights)
+    sector_cdf = np.cumsum(weights)
+    sector_cdf[-1] = 1.0
+    sec_code = np.searchsorted(sector_cdf, u[:, 0], side='right')
 
     # 2. Exposure: Log-normal (Skewed to simulate realistic corporate loan sizes)
-    exposure = np.random.lognormal(mean=16.1, sigma=1.0, size=n_clients)
+    exposure = rng.lognormal(mean=16.1, sigma=1.0, size=n_clients)
     exposure = np.round(exposure, -5)
 
-    env_risk, soc_risk, green_tag = [], [], []
-
-    for sec in client_sectors:
-        # Environmental Risk Logic (Sector Correlated)
-        if sec in ['Oil & Gas', 'Agribusiness', 'Manufacturing']:
-            # Heavy Industry = Higher Environmental Risk
-            env_risk.append(np.random.choice(risk_levels, p=[0.6, 0.3, 0.1])) 
-            green_tag.append(False)
-        elif sec == 'Renewable Energy':
-            env_risk.append('Low')
-            green_tag.append(True)
-        else:
-            env_risk.append(np.random.choice(risk_levels, p=[0.1, 0.4, 0.5]))
-            green_tag.append(False)
-
-        # Social Risk Logic (Labor/Community focus)
-        if sec in ['Agribusiness', 'Infrastructure']:
-            soc_risk.append(np.random.choice(risk_levels, p=[0.5, 0.4, 0.1]))
-        else:
-            soc_risk.append(np.random.choice(risk_levels, p=[0.1, 0.4, 0.5]))
+    # Environmental & Social Risk Logic (Sector Correlated)
+    env_code = draw(env_probs[sec_code], u[:, 1])
+    soc_code = draw(soc_probs[sec_code], u[:, 2])
+    green_tag = sec_code == SECTORS.index('Renewable Energy')
 
     # 3. ESAP Execution Logic (Operational Risk)
     # High Risk clients struggle more; higher rate of 'Delayed' and 'Not Started'
-    esap_status = []
-    for r in env_risk:
-        if r == 'High':
-            esap_status.append(np.random.choice(esap_states, p=[0.1, 0.3, 0.4, 0.2]))
-        else:
-            esap_status.append(np.random.choice(esap_states, p=[0.3, 0.4, 0.1, 0.2]))
+    esap_probs = np.where(
+        (env_code == RISK_LEVELS.index('High'))[:, None],
+        [0.1, 0.3, 0.4, 0.2],
+        [0.3, 0.4, 0.1, 0.2]
+    )
+    esap_code = draw(esap_probs, u[:, 3])
+
+    # Countries are equally likely
+    country_code = (u[:, 4] * len(COUNTRIES)).astype(np.intp)
+
+    return sec_code, country_code, exposure, env_code, soc_code, esap_code, green_tag
+
+def generate_portfolio(rng, n_clients=400):
+    """
+    Simulates a multi-country commercial loan portfolio (Emerging Markets).
+    Includes sector-correlated Environmental & Social risk characteristics.
+    """
+    sec_code, country_code, exposure, env_code, soc_code, esap_code, green_tag = \
+        simulate_loan_tape(n_clients, rng)
 
     df = pd.DataFrame({
-        'Client_ID': [f'CL-{1000+i}' for i in range(n_clients)],
-        'Country': np.random.choice(countries, n_clients),
-        'Sector': client_sectors,
-        'Exposure_USD': exposure,
-        'Env_Risk': env_risk,
-        'Soc_Risk': soc_risk,
-        'ESAP_Status': esap_status,
+        'Country': pd.Categorical.from_codes(country_code, categories=COUNTRIES),
+        'Sector': pd.Categorical.from_codes(sec_code, categories=SECTORS),
+        'Exposure_USD': exposure.astype(np.float32),  # Halves scan bandwidth; totals accumulate in float64
+        'Env_Risk': pd.Categorical.from_codes(env_code, categories=RISK_LEVELS, ordered=True),
+        'Soc_Risk': pd.Categorical.from_codes(soc_code, categories=RISK_LEVELS, ordered=True),
+        'ESAP_Status': pd.Categorical.from_codes(esap_code, categories=ESAP_STATES),
         'Green_Tagged': green_tag
-    })
+    }, index=pd.RangeIndex(1000, 1000 + n_clients, name='Client_ID'))  # CL-1000, CL-1001, ...
 
     return df
 
-df = generate_portfolio()
-print(f"phase 1 Complete: Loaded {len(df)} Clients. Total Exposure: ${df['Exposure_USD'].sum()/1e9:,.2f}B")
-
 # ==============================================================================
 # PHASE 2: CONSERVATIVE RISK SCORING (NON-COMPENSATORY)
 # ==============================================================================
 
-# Map Ratings to Scores
-risk_map = {'High': 3, 'Medium': 2, 'Low': 1}
-df['E_Score'] = df['Env_Risk'].map(risk_map)
-df['S_Score'] = df['Soc_Risk'].map(risk_map)
+def score_portfolio(df):
+    """
+    Adds ordinal E/S scores, the non-compensatory Max_Risk_Score and the
+    Watchlist flag to the loan tape (in place) and returns it.
+    """
+    # Map Ratings to Scores (ordered categories: Low=1, Medium=2, High=3)
+    df['E_Score'] = df['Env_Risk'].cat.codes.to_numpy(dtype=np.int8) + 1
+    df['S_Score'] = df['Soc_Risk'].cat.codes.to_numpy(dtype=np.int8) + 1
+
+    # CORRECTED LOGIC: Non-Compensatory Scoring
+    # Use max() instead of average. A 'High' in E OR S triggers High Overall Risk.
+    df['Max_Risk_Score'] = np.maximum(df['E_Score'].to_numpy(), df['S_Score'].to_numpy())
+
+    # CORRECTED LOGIC: Watchlist Definition
+    # High Risk (3) AND (Delayed OR Not Started) action plans.
+    df['Watchlist'] = (
+        (df['Max_Risk_Score'] == 3) &
+        (df['ESAP_Status'].isin(['Delayed', 'Not Started']))
+    )
 
-# CORRECTED LOGIC: Non-Compensatory Scoring
-# Use max() instead of average. A 'High' in E OR S triggers High Overall Risk.
-df['Max_Risk_Score'] = df[['E_Score', 'S_Score']].max(axis=1)
+    return df
 
-# CORRECTED LOGIC: Watchlist Definition
-# High Risk (3) AND (Delayed OR Not Started) action plans.
-df['Watchlist'] = np.where(
-    (df['Max_Risk_Score'] == 3) & 
-    (df['ESAP_Status'].isin(['Delayed', 'Not Started'])), 
-    True, False
-)
+def compute_risk_heatmap(df):
+    """Exposure ($M) by Sector x Environmental Risk, columns in High/Medium/Low order."""
+    # Sector x Env_Risk exposure matrix, accumulated straight from the category codes
+    exposure_matrix = np.zeros((len(df['Sector'].cat.categories), len(df['Env_Risk'].cat.categories)))
+    np.add.at(
+        exposure_matrix,
+        (df['Sector'].cat.codes.to_numpy(), df['Env_Risk'].cat.codes.to_numpy()),
+        df['Exposure_USD'].to_numpy()
+    )
+    pivot_risk = pd.DataFrame(
+        exposure_matrix / 1e6, index=df['Sector'].cat.categories, columns=df['Env_Risk'].cat.categories
+    )
+    return pivot_risk[['High', 'Medium', 'Low']] # Logical Order
 
-# --- VISUAL 1: SECTOR EXPOSURE HEATMAP ---
-print(">>> GENERATING DIAGNOSTIC 1: RISK HEATMAP...")
-pivot_risk = df.pivot_table(index='Sector', columns='Env_Risk', values='Exposure_USD', aggfunc='sum') / 1e6
-pivot_risk = pivot_risk[['High', 'Medium', 'Low']] # Logical Order
+def compute_watchlist(df):
+    """Watchlisted exposure ($M) and client count."""
+    watchlist_exposure = df.loc[df['Watchlist'], 'Exposure_USD'].to_numpy().sum(dtype=np.float64) / 1e6
+    watchlist_count = int(df['Watchlist'].sum())
+    return watchlist_exposure, watchlist_count
 
-plt.figure(figsize=(10, 5))
-# Annot=True puts the numbers in the boxes (Critical for Consulting)
-sns.heatmap(pivot_risk, annot=True, fmt=".0f", cmap="Reds", cbar_kws={'label': 'Exposure ($M)'})
-plt.title("Portfolio Concentration: Exposure ($M) by Sector & Environmental Risk")
-plt.tight_layout()
-plt.show()
+# --- VISUAL 1: SECTOR EXPOSURE HEATMAP ---
+def plot_heatmap(pivot_risk):
+    setup_plotting()
+    print(">>> GENERATING DIAGNOSTIC 1: RISK HEATMAP...")
+    fig, ax = plt.subplots(figsize=(10, 5))
+    values = pivot_risk.to_numpy()
+    im = ax.imshow(values, cmap='Reds', aspect='auto')
+    ax.set_xticks(range(values.shape[1]), pivot_risk.columns)
+    ax.set_yticks(range(values.shape[0]), pivot_risk.index)
+    ax.set_xlabel('Env_Risk'); ax.set_ylabel('Sector')
+    ax.grid(False)
+    # Numbers in the boxes (Critical for Consulting); white text on the darker cells
+    for (i, j), v in np.ndenumerate(values):
+        ax.text(j, i, f"{v:.0f}", ha='center', va='center', color='white' if v > values.max() / 2 else 'black')
+    fig.colorbar(im, ax=ax, label='Exposure ($M)')
+    plt.title("Portfolio Concentration: Exposure ($M) by Sector & Environmental Risk")
+    plt.tight_layout()
+    show_or_save(fig, 'phase2_risk_heatmap')
 
 # ==============================================================================
 # PHASE 3: OPERATIONAL EXECUTION (ESAP BOTTLENECK)
 # ==============================================================================
 
-# Focus on Clients flagged as High Risk (Score = 3)
-high_risk_only = df[df['Max_Risk_Score'] == 3]
-esap_summary = high_risk_only.groupby('ESAP_Status')['Exposure_USD'].sum() / 1e6
+def compute_execution_gap(df):
+    """
+    High-risk exposure ($M) by ESAP status in logical execution order, plus
+    the failed-compliance total (Delayed + Not Started).
+    """
+    # Focus on Clients flagged as High Risk (Score = 3) -- masked weights, no filtered copy of df
+    high_risk = df['Max_Risk_Score'].to_numpy() == 3
+    esap_summary = pd.Series(
+        np.bincount(
+            df['ESAP_Status'].cat.codes.to_numpy(),
+            weights=df['Exposure_USD'].to_numpy() * high_risk,
+            minlength=len(ESAP_STATES)
+        ) / 1e6,
+        index=pd.Index(ESAP_STATES, name='ESAP_Status')
+    )
+
+    # Reindex for logical execution order
+    esap_summary = esap_summary.reindex(
+        ['Closed', 'Delayed', 'In Progress', 'Not Started'], fill_value=0
+    )
+
+    failed_compliance = esap_summary.get('Delayed', 0) + esap_summary.get('Not Started', 0)
+    return esap_summary, failed_compliance
 
 # --- VISUAL 2: EXECUTION GAP ANALYSIS ---
-print(">>> GENERATING DIAGNOSTIC 2: OPERATIONAL FAILURE CHART...")
-plt.figure(figsize=(9, 5))
-
-# Reindex for logical execution order
-esap_summary = esap_summary.reindex(
-    ['Closed', 'Delayed', 'In Progress', 'Not Started']
-)
-
-# Soft consulting-grade palette
-colors = ['#A8D5BA', '#E6A0A0', '#F2D8A7', '#C9CED6']
-
-ax = esap_summary.plot(
-    kind='bar',
-    color=colors,
-    edgecolor='none'
-)
-
-plt.title(
-    "Execution Gap: High-Risk Exposure by ESAP Status",
-    fontsize=13,
-    pad=12
-)
-plt.ylabel("Exposure ($M)", fontsize=10)
-plt.xticks(rotation=0)
-plt.grid(axis='y', linestyle='--', alpha=0.25)
-
-# Value annotations (subtle, not loud)
-for p in ax.patches:
-    ax.annotate(
-        f'${p.get_height():.0f}M',
-        (p.get_x() + p.get_width() / 2., p.get_height()),
-        ha='center',
-        va='bottom',
-        fontsize=9,
-        xytext=(0, 6),
-        textcoords='offset points'
+def plot_execution_gap(esap_summary):
+    setup_plotting()
+    print(">>> GENERATING DIAGNOSTIC 2: OPERATIONAL FAILURE CHART...")
+    fig = plt.figure(figsize=(9, 5))
+
+    # Soft consulting-grade palette
+    colors = ['#A8D5BA', '#E6A0A0', '#F2D8A7', '#C9CED6']
+
+    ax = esap_summary.plot(
+        kind='bar',
+        color=colors,
+        edgecolor='none'
     )
 
-plt.tight_layout()
-plt.show()
+    plt.title(
+        "Execution Gap: High-Risk Exposure by ESAP Status",
+        fontsize=13,
+        pad=12
+    )
+    plt.ylabel("Exposure ($M)", fontsize=10)
+    plt.xticks(rotation=0)
+    plt.grid(axis='y', linestyle='--', alpha=0.25)
+
+    # Value annotations (subtle, not loud)
+    for p in ax.patches:
+        ax.annotate(
+            f'${p.get_height():.0f}M',
+            (p.get_x() + p.get_width() / 2., p.get_height()),
+            ha='center',
+            va='bottom',
+            fontsize=9,
+            xytext=(0, 6),
+            textcoords='offset points'
+        )
 
-failed_compliance = esap_summary.get('Delayed', 0) + esap_summary.get('Not Started', 0)
-print(f"CRITICAL INSIGHT: ${failed_compliance:,.1f}M of High-Risk exposure has unmitigated issues.")
+    plt.tight_layout()
+    show_or_save(fig, 'phase3_execution_gap')
 
 # ==============================================================================
 # PHASE 4: TRANSITION RISK SCENARIO (OVERLAY INDEX)
@@ -179,28 +268,33 @@ print(f"CRITICAL INSIGHT: ${failed_compliance:,.1f}M of High-Risk exposure has u
 # NOTE: This models "Transition Sensitivity" as a normalized index.
 # ==============================================================================
 
-def plot_transition_risk_overlay():
-    print(">>> GENERATING DIAGNOSTIC 3: TRANSITION SCENARIO OVERLAY...")
-    
+def compute_transition_pathway(rng):
+    """Returns (years, port_pathway, reg_pathway) for the 2025-2035 scenario overlay."""
     # 1. Timeline & Baseline
     years = np.arange(2025, 2036) # 10-year strategic horizon
     n = len(years)
     baseline_index = 100 # Index 100 = Current 2025 Risk Profile
+    exponents = np.arange(n) # Years since baseline, shared by both pathways
     
     # 2. Scenario 1: Regulatory-Aligned Pathway
     # Assumption: Regulators expect a ~6% annual reduction in transition risk exposure
     reg_decay_rate = 0.06 
-    reg_pathway = [baseline_index * ((1 - reg_decay_rate) ** i) for i in range(n)]
+    reg_pathway = baseline_index * np.power(1 - reg_decay_rate, exponents)
     
     # 3. Scenario 2: Portfolio BAU Pathway (The "Inertia" View)
     # Assumption: Due to high "Delayed" ESAPs, portfolio only de-risks at ~1.5% annually.
     bau_decay_rate = 0.015
-    port_pathway = [baseline_index * ((1 - bau_decay_rate) ** i) for i in range(n)]
+    port_pathway = baseline_index * np.power(1 - bau_decay_rate, exponents)
     
     # Add minor volatility
-    noise = np.random.normal(0, 1.2, n)
-    port_pathway = np.array(port_pathway) + noise
-    reg_pathway = np.array(reg_pathway)
+    noise = rng.normal(0, 1.2, n)
+    port_pathway = port_pathway + noise
+
+    return years, port_pathway, reg_pathway
+
+def plot_transition_risk_overlay(years, port_pathway, reg_pathway):
+    setup_plotting()
+    print(">>> GENERATING DIAGNOSTIC 3: TRANSITION SCENARIO OVERLAY...")
     risk_gap = port_pathway - reg_pathway
 
     # --- VISUALIZATION (Dark Mode / Stress Test Aesthetic) ---
@@ -246,31 +340,57 @@ def plot_transition_risk_overlay():
                 ha="center", fontsize=8, color="#888888", style='italic')
 
     plt.tight_layout()
-    plt.show()
+    show_or_save(fig, 'phase4_transition_overlay')
     plt.style.use('default') # Reset style
 
-# Execute Phase 4
-plot_transition_risk_overlay()
-
 # ==============================================================================
 # PHASE 5: EXECUTIVE SUMMARY
 # ==============================================================================
 
-watchlist_exposure = df[df['Watchlist']]['Exposure_USD'].sum() / 1e6
-watchlist_count = df['Watchlist'].sum()
-green_ratio = (df[df['Green_Tagged']]['Exposure_USD'].sum() / df['Exposure_USD'].sum()) * 100
-
-summary = f"""
+def main():
+    parser = argparse.ArgumentParser(description="E&S risk screening & ESAP tracking diagnostic")
+    parser.add_argument('--no-plot', action='store_true',
+                        help="Compute and print the diagnostic without drawing any charts")
+    args = parser.parse_args()
+
+    print(">>> INITIALIZING ESG RISK DIAGNOSTIC ENGINE...")
+    rng = np.random.default_rng(2024)  # Ensures the "Client Scenario" is reproducible
+
+    df = generate_portfolio(rng)
+    total_exposure = df['Exposure_USD'].to_numpy().sum(dtype=np.float64)
+    print(f"phase 1 Complete: Loaded {len(df)} Clients. Total Exposure: ${total_exposure/1e9:,.2f}B")
+
+    # Compute every diagnostic first; charts only consume these outputs
+    df = score_portfolio(df)
+    pivot_risk = compute_risk_heatmap(df)
+    esap_summary, failed_compliance = compute_execution_gap(df)
+    years, port_pathway, reg_pathway = compute_transition_pathway(rng)
+    watchlist_exposure, watchlist_count = compute_watchlist(df)
+    metrics = {
+        'watchlist_exposure': watchlist_exposure,
+        'watchlist_count': watchlist_count,
+        'failed_compliance': failed_compliance,
+        'risk_gap': port_pathway - reg_pathway,
+        'green_ratio': (df.loc[df['Green_Tagged'], 'Exposure_USD'].to_numpy().sum(dtype=np.float64) / total_exposure) * 100
+    }
+    print(f"CRITICAL INSIGHT: ${failed_compliance:,.1f}M of High-Risk exposure has unmitigated issues.")
+
+    if not args.no_plot:
+        plot_heatmap(pivot_risk)
+        plot_execution_gap(esap_summary)
+        plot_transition_risk_overlay(years, port_pathway, reg_pathway)
+
+    summary = f"""
 ===========================================================================
 RISK ADVISORY SUMMARY: ESG PORTFOLIO DIAGNOSTIC
 ===========================================================================
 1. EXPOSURE AT RISK (WATCHLIST):
-   - ${watchlist_exposure:,.1f} M ({watchlist_count} Clients) flagged.
+   - ${metrics['watchlist_exposure']:,.1f} M ({metrics['watchlist_count']} Clients) flagged.
    - Criteria: High Risk (Max Logic) AND (Delayed/Not Started) ESAP.
    - Correction: Used Non-Compensatory Scoring to prevent risk masking.
 
 2. OPERATIONAL FAILURE:
-   - ${failed_compliance:,.1f} M of High-Risk exposure lacks valid mitigation.
+   - ${metrics['failed_compliance']:,.1f} M of High-Risk exposure lacks valid mitigation.
    - "Not Started" plans in Oil & Gas are the primary driver.
 
 3. STRATEGIC TRANSITION GAP:
@@ -283,4 +403,7 @@ RISK ADVISORY SUMMARY: ESG PORTFOLIO DIAGNOSTIC
    - Apply stricter underwriting to clients increasing the Transition Gap.
 ===========================================================================
 """
-print(summary)
\ No newline at end of file
+    print(summary)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file